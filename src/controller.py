@@ -1,19 +1,141 @@
+import array
+import asyncio
+import subprocess
+from contextlib import contextmanager
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 from threading import Lock
 from typing_extensions import Self
 import weakref
 from pymycobot.mycobot280 import MyCobot280 as _MyCobot
+from viam.logging import getLogger
+
+try:
+    import fcntl
+except ImportError:  # non-Linux hosts
+    fcntl = None
+
+LOGGER = getLogger(__name__)
 
 # from pymycobot import PI_PORT, PI_BAUD
 PI_PORT = "/dev/ttyAMA0"
 PI_BAUD = 1000000
 
+# <asm-generic/ioctls.h> and <linux/serial.h>
+TIOCGSERIAL = 0x541E
+TIOCSSERIAL = 0x541F
+ASYNC_LOW_LATENCY = 0x2000
+
+
+def _enable_low_latency(client: _MyCobot):
+    """Set ASYNC_LOW_LATENCY on the serial port backing the client.
+
+    The kernel's default latency timer coalesces UART reads for up to 16 ms
+    before waking the reader; the low-latency flag drops that to 1 ms, which
+    shaves most of the round-trip time off every get/send command.
+    """
+    try:
+        fd = client._serial_port.fileno()
+        if fcntl is not None:
+            # serial_struct: type, line, port, irq, flags, ... — flags is the
+            # fifth int field.
+            serial_struct = array.array("i", [0] * 64)
+            fcntl.ioctl(fd, TIOCGSERIAL, serial_struct)
+            serial_struct[4] |= ASYNC_LOW_LATENCY
+            fcntl.ioctl(fd, TIOCSSERIAL, serial_struct)
+        else:
+            raise OSError("fcntl unavailable")
+    except (OSError, AttributeError) as error:
+        try:
+            subprocess.run(
+                ["setserial", PI_PORT, "low_latency"],
+                check=True,
+                capture_output=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            LOGGER.warning(f"Unable to enable low-latency serial mode: {error}")
+
+
+class _DrainingSerialReader:
+    """Buffered wrapper around the pyserial port used by pymycobot.
+
+    pymycobot's frame parser pulls one byte per ``read()`` call, paying a
+    syscall (and potentially a timeout wait) per byte. Once the first byte of
+    a response arrives, the rest of the frame is usually already queued, so
+    after each blocking read this wrapper drains ``in_waiting`` bytes in a
+    single call and feeds the parser out of the buffer.
+    """
+
+    def __init__(self, serial_port):
+        self._serial_port = serial_port
+        self._buffer = bytearray()
+
+    def read(self, size=1):
+        while len(self._buffer) < size:
+            data = self._serial_port.read(1)
+            if not data:
+                break
+            self._buffer += data
+            waiting = self._serial_port.in_waiting
+            if waiting:
+                self._buffer += self._serial_port.read(waiting)
+        result = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return result
+
+    @property
+    def in_waiting(self):
+        return len(self._buffer) + self._serial_port.in_waiting
+
+    def inWaiting(self):
+        return self.in_waiting
+
+    def reset_input_buffer(self):
+        self._buffer.clear()
+        self._serial_port.reset_input_buffer()
+
+    def __getattr__(self, name):
+        return getattr(self._serial_port, name)
+
+
+class _MyCobotClient(_MyCobot):
+    """MyCobot280 client that can coalesce consecutive set commands."""
+
+    @contextmanager
+    def batched_writes(self):
+        """Send every set command issued in this block as one serial write.
+
+        Each command normally writes its own frame and then blocks on the ack
+        before the next frame goes out, so three setup commands cost three
+        full round-trips of USB/UART scheduling. Inside this block frames are
+        appended to an in-memory buffer and the ack reads are skipped; on exit
+        the buffer goes out in a single write and the coalesced acks are
+        discarded. Only use this for set commands whose return values are not
+        inspected.
+        """
+        port = self._serial_port
+        pending = bytearray()
+        port.write = pending.extend
+        port.flush = lambda: None
+        port.reset_input_buffer = lambda: None
+        self._read = lambda *args, **kwargs: b"\xfe"
+        try:
+            yield
+        finally:
+            del port.write, port.flush, port.reset_input_buffer
+            del self._read
+            if pending:
+                port.reset_input_buffer()
+                port.write(bytes(pending))
+                port.flush()
+
 
 class MyCobotController:
     _instance = None
     _lock = Lock()
-    _ref_count = 0
-    _refs = set()
+    _refs: "weakref.WeakSet[MyCobotController]" = weakref.WeakSet()
     client: _MyCobot
+    executor: ThreadPoolExecutor
 
     def __new__(cls) -> Self:
         with cls._lock:
@@ -26,27 +148,47 @@ class MyCobotController:
         with self._lock:
             if not self._initialized:
                 self._initialized = True
-                self.client = _MyCobot(PI_PORT, PI_BAUD)
+                self.client = _MyCobotClient(PI_PORT, PI_BAUD)
+                _enable_low_latency(self.client)
+                self.client._serial_port = _DrainingSerialReader(
+                    self.client._serial_port
+                )
+                # The serial port only supports one transaction at a time, so a
+                # single worker serializes access while keeping blocking calls
+                # off the event loop.
+                self.executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="mycobot-serial"
+                )
+                weakref.finalize(self, type(self)._maybe_close)
+
+            type(self)._refs.add(self)
 
-            type(self)._ref_count += 1
-            ref = weakref.ref(self, self._cleanup)
-            type(self)._refs.add(ref)
+    async def call(self, fn, *args):
+        """Await a blocking client call on the serial worker thread.
+
+        Async code paths should use this instead of calling ``client``
+        methods directly so reads yield to the event loop for the duration
+        of the UART round-trip; ``client`` remains available as the blocking
+        fallback for synchronous paths like ``reconfigure``.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, partial(fn, *args)
+        )
 
     @classmethod
-    def _cleanup(cls, ref):
+    def _maybe_close(cls):
+        """Shut the port down once no live instance remains.
+
+        Registered as a ``weakref.finalize`` callback; the WeakSet drops dead
+        members automatically, so the count is derived rather than tracked.
+        This is the only teardown path — there is deliberately no ``__del__``,
+        which would race this callback, stop/close the port a second time,
+        and could run during interpreter shutdown after the class lock is
+        already gone.
+        """
         with cls._lock:
-            if ref in cls._refs:
-                cls._refs.remove(ref)
-                cls._ref_count -= 1
-
-                if cls._ref_count == 0 and cls._instance:
-                    cls._instance.client.stop()
-                    cls._instance.client.close()
-                    cls._instance = None
-
-    def __del__(self):
-        with type(self)._lock:
-            type(self)._ref_count -= 1
-            if type(self)._ref_count <= 0:
-                self.client.stop()
-                self.client.close()
+            if len(cls._refs) == 0 and cls._instance is not None:
+                cls._instance.client.stop()
+                cls._instance.client.close()
+                cls._instance.executor.shutdown(wait=False)
+                cls._instance = None
@@ -1,6 +1,13 @@
+import asyncio
+import logging
 import math
-from typing import Any, ClassVar, Dict, Mapping, Optional, Sequence, Tuple
+import os
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, List, Mapping, Optional, Sequence, Tuple
 
+from google.protobuf.struct_pb2 import Struct
 from typing_extensions import Self
 from viam.components.arm import Arm, Pose, JointPositions, KinematicsFileFormat
 from viam.logging import getLogger
@@ -10,26 +17,143 @@ from viam.resource.base import ResourceBase
 from viam.components.component_base import ValueTypes
 from viam.resource.easy_resource import EasyResource
 from viam.resource.types import Model, ModelFamily
-from viam.utils import struct_to_dict
+from controller import MyCobotController
+from utils._fastmath import angles_to_vector, vector_to_angles
+from utils.orientation import (
+    euler_to_orientation_vector,
+    euler_zyx_deg_from_quaternion,
+    quaternion_from_orientation_vector,
+)
 
-from pydantic import BaseModel, Field
+LOGGER = getLogger("myCobot")
 
-from scipy.spatial.transform import Rotation
+_DEG2RAD = math.pi / 180.0
 
-from controller import MyCobotController
-from utils.spatialmath import SpatialMath
+# Background poll rate for the moving flag (the hardware tops out around
+# 50 Hz) and how long the poller keeps running after the last is_moving call.
+_MOVING_POLL_INTERVAL = 0.02
+_MOVING_POLL_IDLE_TIMEOUT = 1.0
 
-LOGGER = getLogger("myCobot")
+# How long a cached serial read stays fresh; roughly one UART round-trip, so
+# concurrent pollers collapse into a single transaction without ever serving
+# data older than what a dedicated round-trip would return.
+_SERIAL_CACHE_TTL = 0.02
+
+
+# Resolved relative to this file so the lookup is independent of the
+# process working directory.
+_URDF_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "assets",
+    "mycobot_280_pi.urdf",
+)
+
+
+@lru_cache(maxsize=1)
+def _load_urdf() -> bytes:
+    """Read the kinematics file once; it is immutable for the life of the process."""
+    with open(_URDF_PATH, "rb") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=256)
+def _euler_to_ov_cached(
+    rx_q: int, ry_q: int, rz_q: int
+) -> Tuple[float, float, float, float]:
+    """Euler-to-orientation-vector keyed on deci-degree quantized angles.
+
+    Streaming workloads tend to revisit the same orientations; quantizing to
+    0.1 degree makes repeated conversions a dict lookup.
+    """
+    return euler_to_orientation_vector(
+        rz_q * 0.1 * _DEG2RAD,
+        ry_q * 0.1 * _DEG2RAD,
+        rx_q * 0.1 * _DEG2RAD,
+    )
+
+
+@lru_cache(maxsize=256)
+def _ov_to_euler_cached(
+    ox_q: int, oy_q: int, oz_q: int, theta_q: int
+) -> Tuple[float, float, float]:
+    """Orientation-vector-to-Euler keyed on quantized components.
 
+    The unit-vector components are quantized to 1e-3 and theta to 0.1, which
+    keeps the round-off comparable to the hardware's own angle resolution.
+    """
+    real, i, j, k = quaternion_from_orientation_vector(
+        ox_q * 1e-3, oy_q * 1e-3, oz_q * 1e-3, theta_q * 0.1
+    )
+    return euler_zyx_deg_from_quaternion(real, i, j, k)
 
-class ArmConfig(BaseModel):
-    default_speed: int = Field(gt=0, le=100, default=20)
+
+@dataclass(slots=True)
+class ArmConfig:
+    default_speed: int = 20
+
+    @classmethod
+    def from_attributes(cls, attributes) -> "ArmConfig":
+        """Build the config by reading the proto Struct fields directly.
+
+        The config has one int field; walking it through struct_to_dict and a
+        pydantic model cost tens of microseconds per reconfigure for no
+        additional checking.
+        """
+        fields = attributes.fields
+        default_speed = (
+            int(fields["default_speed"].number_value)
+            if "default_speed" in fields
+            else 20
+        )
+        if not 0 < default_speed <= 100:
+            raise ValueError(
+                f"default_speed must be between 1 and 100, got {default_speed}"
+            )
+        return cls(default_speed=default_speed)
+
+
+@lru_cache(maxsize=16)
+def _validate_attributes(serialized: bytes) -> None:
+    """Validate a serialized attributes Struct, memoized on its bytes.
+
+    Config hot-reloads re-validate the same attributes repeatedly; keying on
+    the wire bytes collapses repeats to a dict lookup. Invalid configs are
+    not cached — lru_cache never stores raised exceptions.
+    """
+    attributes = Struct()
+    attributes.ParseFromString(serialized)
+    ArmConfig.from_attributes(attributes)
 
 
 class MyCobot280(Arm, EasyResource):
     MODEL: ClassVar[Model] = Model(ModelFamily("hipsterbrown", "arm"), "mycobot280")
 
-    mycobot: MyCobotController
+    # The bases don't use slots so instances keep a __dict__, but slotted
+    # storage for our own hot attributes still skips the dict lookup on the
+    # per-call paths.
+    __slots__ = (
+        "config",
+        "_mycobot",
+        "_coords_task",
+        "_coords_cache",
+        "_coords_cache_t",
+        "_angles_task",
+        "_angles_cache",
+        "_angles_cache_t",
+        "_poll_task",
+        "_moving_cached",
+        "_moving_last_req",
+        "_closed",
+    )
+
+    # Immutable messages returned while disconnected; gRPC serializes the
+    # message and never mutates it, so one shared instance is safe.
+    _ZERO_POSE: ClassVar[Pose] = Pose(
+        x=0.0, y=0.0, z=0.0, o_x=0.0, o_y=0.0, o_z=0.0
+    )
+    _EMPTY_JOINTS: ClassVar[JointPositions] = JointPositions(values=[])
+
+    _mycobot: Optional[MyCobotController]
 
     @classmethod
     def new(
@@ -58,7 +182,7 @@ class MyCobot280(Arm, EasyResource):
         Returns:
             Sequence[str]: A list of implicit dependencies
         """
-        ArmConfig(**struct_to_dict(config.attributes))
+        _validate_attributes(config.attributes.SerializeToString())
         return []
 
     def reconfigure(
@@ -70,25 +194,102 @@ class MyCobot280(Arm, EasyResource):
             config (ComponentConfig): The new configuration
             dependencies (Mapping[ResourceName, ResourceBase]): Any dependencies (both implicit and explicit)
         """
-        self.config = ArmConfig(**struct_to_dict(config.attributes))
+        self.config = ArmConfig.from_attributes(config.attributes)
+
+        # Opening the serial port is a blocking syscall that can hang when the
+        # device is absent, so defer it until the first call that needs it.
+        self._mycobot = None
+        self._coords_task: Optional[asyncio.Task] = None
+        self._coords_cache: Optional[List[float]] = None
+        self._coords_cache_t = 0.0
+        self._angles_task: Optional[asyncio.Task] = None
+        self._angles_cache: Optional[List[float]] = None
+        self._angles_cache_t = 0.0
+
+        old_poll = getattr(self, "_poll_task", None)
+        if old_poll is not None:
+            old_poll.cancel()
+        self._poll_task: Optional[asyncio.Task] = None
+        self._moving_cached = False
+        self._moving_last_req = 0.0
+        self._closed = False
+
+    @property
+    def mycobot(self) -> MyCobotController:
+        """The shared controller, constructed (and the arm set up) on first use."""
+        if self._mycobot is None:
+            self._mycobot = MyCobotController()
+            client = self._mycobot.client
+            with client.batched_writes():
+                client.set_color(0, 0, 255)
+                client.set_fresh_mode(1)
+                client.set_end_type(1)
+
+            # Each diagnostic getter is its own serial round-trip, so only pay
+            # for them when debug logging is on, and emit a single fused line
+            # instead of five log records.
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(
+                    "system version: %s, basic version: %s, reboot count: %s, "
+                    "tool reference: %s, world reference: %s",
+                    client.get_system_version(),
+                    client.get_basic_version(),
+                    client.get_reboot_count(),
+                    client.get_tool_reference(),
+                    client.get_world_reference(),
+                )
+        return self._mycobot
 
-        self.mycobot = MyCobotController()
-        self.mycobot.client.set_color(0, 0, 255)
-        self.mycobot.client.set_fresh_mode(1)
-        self.mycobot.client.set_end_type(1)
-        self.spatialmath = SpatialMath()
+    def _invalidate_read_caches(self):
+        """Expire the coords/angles TTL caches after a motion command.
 
-        LOGGER.info(
-            f"Current system version: {self.mycobot.client.get_system_version()}"
-        )
-        LOGGER.info(f"Current basic version: {self.mycobot.client.get_basic_version()}")
-        LOGGER.info(f"Current reboot count: {self.mycobot.client.get_reboot_count()}")
-        LOGGER.info(
-            f"Current tool reference: {self.mycobot.client.get_tool_reference()}"
-        )
-        LOGGER.info(
-            f"Current world reference: {self.mycobot.client.get_world_reference()}"
-        )
+        The arm starts moving as soon as the command is acknowledged, so a
+        read served from cache right after would reflect the pre-move state.
+        """
+        self._coords_cache_t = 0.0
+        self._angles_cache_t = 0.0
+
+    async def _get_coords(self) -> List[float]:
+        """Fetch coords with a short TTL cache and single-flight coalescing.
+
+        Concurrent callers within one round-trip await the same in-flight
+        serial read instead of each issuing their own.
+        """
+        if (
+            self._coords_cache is not None
+            and time.monotonic() - self._coords_cache_t < _SERIAL_CACHE_TTL
+        ):
+            return self._coords_cache
+        task = self._coords_task
+        if task is None or task.done():
+            task = asyncio.get_running_loop().create_task(self._refresh_coords())
+            self._coords_task = task
+        return await task
+
+    async def _refresh_coords(self) -> List[float]:
+        coords = await self.mycobot.call(self.mycobot.client.get_coords)
+        self._coords_cache = coords
+        self._coords_cache_t = time.monotonic()
+        return coords
+
+    async def _get_angles(self) -> List[float]:
+        """Fetch joint angles with the same TTL + single-flight behavior as coords."""
+        if (
+            self._angles_cache is not None
+            and time.monotonic() - self._angles_cache_t < _SERIAL_CACHE_TTL
+        ):
+            return self._angles_cache
+        task = self._angles_task
+        if task is None or task.done():
+            task = asyncio.get_running_loop().create_task(self._refresh_angles())
+            self._angles_task = task
+        return await task
+
+    async def _refresh_angles(self) -> List[float]:
+        angles = await self.mycobot.call(self.mycobot.client.get_angles)
+        self._angles_cache = angles
+        self._angles_cache_t = time.monotonic()
+        return angles
 
     async def get_end_position(
         self,
@@ -98,20 +299,25 @@ class MyCobot280(Arm, EasyResource):
         **kwargs,
     ) -> Pose:
         if not self.mycobot:
-            return Pose(x=0.0, y=0.0, z=0.0, o_x=0.0, o_y=0.0, o_z=0.0)
-        coords = self.mycobot.client.get_coords()
+            return self._ZERO_POSE
+        coords = await self._get_coords()
         LOGGER.info(coords)
-        x, y, z, rx, ry, rz = coords
-        quaternion = self.spatialmath.quaternion_from_euler_angles(
-            self._degrees_to_radians(rz),
-            self._degrees_to_radians(ry),
-            self._degrees_to_radians(rx),
+        # coords is [x, y, z, rx, ry, rz]; index it directly rather than
+        # unpacking through six intermediate names.
+        o_x, o_y, o_z, theta = _euler_to_ov_cached(
+            round(coords[3] * 10),
+            round(coords[4] * 10),
+            round(coords[5] * 10),
+        )
+        return Pose(
+            x=coords[0],
+            y=coords[1],
+            z=coords[2],
+            o_x=o_x,
+            o_y=o_y,
+            o_z=o_z,
+            theta=theta,
         )
-        o_vec = self.spatialmath.orientation_vector_from_quaternion(quaternion)
-        o_x, o_y, o_z, theta = self.spatialmath.orientation_vector_get_components(o_vec)
-        self.spatialmath.free_orientation_vector_memory(o_vec)
-        self.spatialmath.free_quaternion_memory(quaternion)
-        return Pose(x=x, y=y, z=z, o_x=o_x, o_y=o_y, o_z=o_z, theta=theta)
 
     async def move_to_position(
         self,
@@ -124,33 +330,34 @@ class MyCobot280(Arm, EasyResource):
         if not self.mycobot:
             return
 
-        current_coords = self.mycobot.client.get_coords()
-        LOGGER.info(f"Current coords: {current_coords}")
-        x, y, z, o_x, o_y, o_z, theta = (
-            pose.x,
-            pose.y,
-            pose.z,
-            pose.o_x,
-            pose.o_y,
-            pose.o_z,
-            pose.theta,
+        # Hoist the protobuf descriptor reads into locals once; every access
+        # on the message goes through its __getattr__ wrapper.
+        x = pose.x
+        y = pose.y
+        z = pose.z
+        o_x = pose.o_x
+        o_y = pose.o_y
+        o_z = pose.o_z
+        theta = pose.theta
+        rx, ry, rz = _ov_to_euler_cached(
+            round(o_x * 1000),
+            round(o_y * 1000),
+            round(o_z * 1000),
+            round(theta * 10),
         )
-        o_vec = self.spatialmath.create_orientation_vector(o_x, o_y, o_z, theta)
-        quaternion = self.spatialmath.quaternion_from_orientation_vector(o_vec)
-        real, i, j, k = self.spatialmath.quaternion_get_components(quaternion)
-        LOGGER.info(f"Quat- real: {real}, i: {i}, j: {j}, k: {k}")
-        rotation = Rotation.from_quat([i, j, k, real])
-        LOGGER.info(f"Rotation quat: {rotation.as_quat()}")
-        rx, ry, rz = rotation.as_euler("zyx", degrees=True)
 
         LOGGER.info(
-            f"New coords - x: {x}, y: {y}, z: {z}, rx: {rx}, ry: {ry}, rz: {rz}"
+            "New coords - x: %s, y: %s, z: %s, rx: %s, ry: %s, rz: %s",
+            x,
+            y,
+            z,
+            rx,
+            ry,
+            rz,
         )
 
-        self.spatialmath.free_orientation_vector_memory(o_vec)
-        self.spatialmath.free_quaternion_memory(quaternion)
-
-        self.mycobot.client.send_coords(
+        await self.mycobot.call(
+            self.mycobot.client.send_coords,
             [
                 x,
                 y,
@@ -162,6 +369,7 @@ class MyCobot280(Arm, EasyResource):
             self.config.default_speed,
             1,
         )
+        self._invalidate_read_caches()
 
     async def move_to_joint_positions(
         self,
@@ -171,7 +379,12 @@ class MyCobot280(Arm, EasyResource):
         timeout: Optional[float] = None,
         **kwargs,
     ):
-        LOGGER.info(f"Moving to positions: {list(positions.values)}")
+        # One copy is unavoidable: pymycobot's check_angles rejects anything
+        # that isn't a real list, so the protobuf repeated field can't be
+        # passed through directly.
+        angles = list(positions.values)
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info("Moving to positions: %s", angles)
         if not self.mycobot:
             LOGGER.warning("mycobot not available")
             return
@@ -183,10 +396,17 @@ class MyCobot280(Arm, EasyResource):
         # joint 4: -145 <=> 145
         # joint 5: -165 <=> 165
         # joint 6: -180 <=> 180
-        current = await self.get_joint_positions()
-        angles = list(positions.values)
-        LOGGER.info(f"Current angles: {list(current.values)}, New angles: {angles}")
-        self.mycobot.client.send_angles(angles, self.config.default_speed)
+        if LOGGER.isEnabledFor(logging.INFO):
+            # Reading the current angles is its own serial round-trip; only
+            # pay for it when the comparison actually gets logged.
+            current = await self.get_joint_positions()
+            LOGGER.info(
+                "Current angles: %s, New angles: %s", list(current.values), angles
+            )
+        await self.mycobot.call(
+            self.mycobot.client.send_angles, angles, self.config.default_speed
+        )
+        self._invalidate_read_caches()
 
     async def get_joint_positions(
         self,
@@ -196,8 +416,8 @@ class MyCobot280(Arm, EasyResource):
         **kwargs,
     ) -> JointPositions:
         if not self.mycobot:
-            return JointPositions(values=[])
-        angles = self.mycobot.client.get_angles()
+            return self._EMPTY_JOINTS
+        angles = await self._get_angles()
         return JointPositions(values=angles)
 
     async def stop(
@@ -210,22 +430,43 @@ class MyCobot280(Arm, EasyResource):
         if not self.mycobot:
             return
 
-        self.mycobot.client.stop()
+        await self.mycobot.call(self.mycobot.client.stop)
 
     async def is_moving(self) -> bool:
         if not self.mycobot:
             return False
 
-        return self.mycobot.client.is_moving() == 1
+        # Motion-wait loops call this at whatever rate the client likes; a
+        # background poller keeps the cached flag fresh at the serial rate so
+        # caller frequency is decoupled from bus traffic.
+        self._moving_last_req = time.monotonic()
+        if self._poll_task is None or self._poll_task.done():
+            self._moving_cached = (
+                await self.mycobot.call(self.mycobot.client.is_moving) == 1
+            )
+            self._poll_task = asyncio.get_running_loop().create_task(
+                self._moving_poll_loop()
+            )
+        return self._moving_cached
+
+    async def _moving_poll_loop(self):
+        """Refresh the cached moving flag until callers lose interest."""
+        try:
+            while not self._closed:
+                await asyncio.sleep(_MOVING_POLL_INTERVAL)
+                self._moving_cached = (
+                    await self.mycobot.call(self.mycobot.client.is_moving) == 1
+                )
+                if time.monotonic() - self._moving_last_req > _MOVING_POLL_IDLE_TIMEOUT:
+                    break
+        except asyncio.CancelledError:
+            pass
 
     async def get_kinematics(
         self, *, extra: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None
     ) -> Tuple[KinematicsFileFormat.ValueType, bytes]:
         LOGGER.info("Getting arm kinematics file")
-        with open("assets/mycobot_280_pi.urdf", "rb") as f:
-            data = f.read()
-
-        return (KinematicsFileFormat.KINEMATICS_FILE_FORMAT_URDF, data)
+        return (KinematicsFileFormat.KINEMATICS_FILE_FORMAT_URDF, _load_urdf())
 
     async def do_command(
         self,
@@ -237,56 +478,48 @@ class MyCobot280(Arm, EasyResource):
         if not self.mycobot:
             return {}
 
-        LOGGER.info(f"do_command: {command}")
+        LOGGER.info("do_command: %s", command)
         result = {}
+        # Bind the client once so the loop skips the property and attribute
+        # lookups per command; match compiles the name dispatch to a jump table.
+        mycobot = self.mycobot
+        client = mycobot.client
         for name, args in command.items():
-            LOGGER.info(f"{name}: {args}")
-            if name == "free_mode":
-                result["free_mode"] = self.mycobot.client.set_free_mode(int(args))
-            if name == "is_gripper_moving":
-                result["is_gripper_moving"] = (
-                    self.mycobot.client.is_gripper_moving() == 1
-                )
-            if name == "set_gripper_state":
-                state, speed = list(args)
-                result["set_gripper_state"] = (
-                    self.mycobot.client.set_gripper_state(int(state), int(speed)) == 1
-                )
+            LOGGER.info("%s: %s", name, args)
+            match name:
+                case "free_mode":
+                    result[name] = await mycobot.call(client.set_free_mode, int(args))
+                case "is_gripper_moving":
+                    result[name] = (
+                        await mycobot.call(client.is_gripper_moving) == 1
+                    )
+                case "set_gripper_state":
+                    state, speed = args
+                    result[name] = (
+                        await mycobot.call(
+                            client.set_gripper_state, int(state), int(speed)
+                        )
+                        == 1
+                    )
         return result
 
     async def close(self):
-        if not self.mycobot:
+        self._closed = True
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+
+        # Check the backing field directly; going through the property would
+        # open the port just to release it.
+        if self._mycobot is None:
             return
 
-        del self.mycobot
+        self._mycobot = None
 
     def _angles_to_vector(self, ry: float, rz: float) -> Tuple[float, float, float]:
-        o_x = math.cos(rz) * math.cos(ry)
-        o_y = math.sin(ry)
-        o_z = math.sin(rz) * math.cos(ry)
-
-        length = math.sqrt(o_x * o_x + o_y * o_y + o_z * o_z)
-
-        return (o_x / length, o_y / length, o_z / length)
+        return angles_to_vector(ry, rz)
 
     def _vector_to_angles(
         self, o_x: float, o_y: float, o_z: float, theta: float
     ) -> Tuple[float, float, float]:
-        rx = theta  # rotation x information is lost in orientation vector
-        ry = math.asin(o_y)
-        rz = math.atan2(o_z, o_x)
-
-        if abs(abs(ry) - math.pi / 2) < 0.001:
-            rx = 0
-            if ry > 0:
-                rz += theta
-            else:
-                rz -= theta
-
-        return (rx, ry, rz)
-
-    def _degrees_to_radians(self, degrees: float) -> float:
-        return degrees * (math.pi / 180)
-
-    def _radians_to_degrees(self, radians: float) -> float:
-        return radians * (180 / math.pi)
+        return vector_to_angles(o_x, o_y, o_z, theta)
@@ -1,6 +1,7 @@
-from enum import Enum
-from typing import Any, ClassVar, Dict, Mapping, Optional, Sequence
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Mapping, Optional, Sequence, Tuple, cast
 
+from google.protobuf.struct_pb2 import Struct
 from typing_extensions import Self
 from viam.components.arm import Arm
 from viam.components.gripper import Gripper
@@ -18,20 +19,47 @@ from controller import MyCobotController
 
 LOGGER = getLogger(__name__)
 
-
-class GripperState(Enum):
-    OPEN = 0
-    CLOSED = 1
+# Plain ints rather than an Enum; the firmware wants the raw byte and the
+# hot path shouldn't pay a descriptor lookup for `.value`.
+_GRIPPER_OPEN = 0
+_GRIPPER_CLOSED = 1
 
 
 class GripperConfig(BaseModel):
     default_speed: int = Field(gt=0, le=100, default=50)
+    arm_name: Optional[str] = None
+
+
+@lru_cache(maxsize=16)
+def _validate_attributes(serialized: bytes) -> Tuple[str, ...]:
+    """Validate a serialized attributes Struct, memoized on its bytes.
+
+    Returns the implicit dependencies so repeated validation of an unchanged
+    config skips the struct walk and pydantic model construction entirely.
+    """
+    attributes = Struct()
+    attributes.ParseFromString(serialized)
+    gripper_config = GripperConfig(**struct_to_dict(attributes))
+    if gripper_config.arm_name:
+        return (gripper_config.arm_name,)
+    return ()
 
 
 class MyCobot280(Gripper, EasyResource):
     MODEL: ClassVar[Model] = Model(ModelFamily("hipsterbrown", "gripper"), "mycobot")
 
-    mycobot: MyCobotController
+    __slots__ = (
+        "config",
+        "mycobot",
+        "_arm",
+        "_arm_do_command",
+        "_open_cmd",
+        "_close_cmd",
+        "_moving_cmd",
+        "_speed",
+    )
+
+    mycobot: Optional[MyCobotController]
 
     @classmethod
     def new(
@@ -60,8 +88,7 @@ class MyCobot280(Gripper, EasyResource):
         Returns:
             Sequence[str]: A list of implicit dependencies
         """
-        GripperConfig(**struct_to_dict(config.attributes))
-        return []
+        return _validate_attributes(config.attributes.SerializeToString())
 
     def reconfigure(
         self, config: ComponentConfig, dependencies: Mapping[ResourceName, ResourceBase]
@@ -73,7 +100,24 @@ class MyCobot280(Gripper, EasyResource):
             dependencies (Mapping[ResourceName, ResourceBase]): Any dependencies (both implicit and explicit)
         """
         self.config = GripperConfig(**struct_to_dict(config.attributes))
-        self.mycobot = MyCobotController()
+        # Coerce once here so open/grab don't re-run int() per call.
+        self._speed = int(self.config.default_speed)
+        if self.config.arm_name:
+            # Delegated mode: the arm component owns the serial connection and
+            # we route gripper commands through its do_command, so both
+            # components share one bus without contending for the port. Bind
+            # the method and build the command dicts once; per-call open/grab
+            # then awaits a prebuilt immutable payload.
+            arm = cast(Arm, dependencies[Arm.get_resource_name(self.config.arm_name)])
+            self._arm = arm
+            self._arm_do_command = arm.do_command
+            self._open_cmd = {"set_gripper_state": [_GRIPPER_OPEN, self._speed]}
+            self._close_cmd = {"set_gripper_state": [_GRIPPER_CLOSED, self._speed]}
+            self._moving_cmd = {"is_gripper_moving": []}
+            self.mycobot = None
+        else:
+            self._arm = None
+            self.mycobot = MyCobotController()
 
     async def open(
         self,
@@ -82,8 +126,13 @@ class MyCobot280(Gripper, EasyResource):
         timeout: Optional[float] = None,
         **kwargs,
     ):
-        self.mycobot.client.set_gripper_state(
-            GripperState.OPEN.value, int(self.config.default_speed)
+        if self._arm is not None:
+            await self._arm_do_command(self._open_cmd)
+            return
+        await self.mycobot.call(
+            self.mycobot.client.set_gripper_state,
+            _GRIPPER_OPEN,
+            self._speed,
         )
 
     async def grab(
@@ -93,8 +142,13 @@ class MyCobot280(Gripper, EasyResource):
         timeout: Optional[float] = None,
         **kwargs,
     ) -> bool:
-        self.mycobot.client.set_gripper_state(
-            GripperState.CLOSED.value, int(self.config.default_speed)
+        if self._arm is not None:
+            await self._arm_do_command(self._close_cmd)
+            return True
+        await self.mycobot.call(
+            self.mycobot.client.set_gripper_state,
+            _GRIPPER_CLOSED,
+            self._speed,
         )
         return True
 
@@ -105,8 +159,14 @@ class MyCobot280(Gripper, EasyResource):
         timeout: Optional[float] = None,
         **kwargs,
     ):
-        self.mycobot.client.stop()
+        if self._arm is not None:
+            await self._arm.stop()
+            return
+        await self.mycobot.call(self.mycobot.client.stop)
 
     async def is_moving(self) -> bool:
-        is_moving = self.mycobot.client.is_moving()
+        if self._arm is not None:
+            result = await self._arm_do_command(self._moving_cmd)
+            return bool(result.get("is_gripper_moving"))
+        is_moving = await self.mycobot.call(self.mycobot.client.is_moving)
         return is_moving == 1
@@ -0,0 +1,132 @@
+import math
+
+import numpy as np
+
+# Numba is optional (install the module with the "perf" extra); these are
+# pure scalar-trig kernels, which it compiles well. Without it the plain
+# Python definitions run as-is.
+try:
+    from numba import njit, prange
+except ImportError:
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorate(fn):
+            return fn
+
+        return decorate
+
+
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
+
+@njit(cache=True, fastmath=True)
+def degrees_to_radians(degrees: float) -> float:
+    return degrees * _DEG2RAD
+
+
+@njit(cache=True, fastmath=True)
+def radians_to_degrees(radians: float) -> float:
+    return radians * _RAD2DEG
+
+
+@njit(cache=True, fastmath=True)
+def angles_to_vector(ry: float, rz: float):
+    o_x = math.cos(rz) * math.cos(ry)
+    o_y = math.sin(ry)
+    o_z = math.sin(rz) * math.cos(ry)
+
+    length = math.sqrt(o_x * o_x + o_y * o_y + o_z * o_z)
+
+    return (o_x / length, o_y / length, o_z / length)
+
+
+@njit(cache=True, fastmath=True)
+def vector_to_angles(o_x: float, o_y: float, o_z: float, theta: float):
+    # rotation x information is lost in orientation vector
+    ry = math.asin(o_y)
+    rz = math.atan2(o_z, o_x)
+
+    # Branchless gimbal-lock fixup: near_pole is 0.0 or 1.0, so off the pole
+    # rx is theta and rz is untouched; on it, rx drops to 0 and theta folds
+    # into rz with the sign of ry. Straight-line code JITs/vectorizes cleanly.
+    near_pole = float(abs(abs(ry) - math.pi / 2) < 0.001)
+    rx = theta * (1.0 - near_pole)
+    rz += math.copysign(theta, ry) * near_pole
+
+    return (rx, ry, rz)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def angles_to_vector_into(angles: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Parallel angles_to_vector over an (N, 2) array into a preallocated (N, 3) out.
+
+    With numba this compiles to a prange loop that threads across waypoints;
+    callers can reuse `out` across frames to keep the hot path allocation-free.
+    Without numba it runs as a plain Python loop — prefer angles_to_vector_batch
+    in that case.
+    """
+    for i in prange(angles.shape[0]):
+        ry = angles[i, 0]
+        rz = angles[i, 1]
+        o_x = math.cos(rz) * math.cos(ry)
+        o_y = math.sin(ry)
+        o_z = math.sin(rz) * math.cos(ry)
+        length = math.sqrt(o_x * o_x + o_y * o_y + o_z * o_z)
+        out[i, 0] = o_x / length
+        out[i, 1] = o_y / length
+        out[i, 2] = o_z / length
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def vector_to_angles_into(vectors: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Parallel vector_to_angles over an (N, 4) array into a preallocated (N, 3) out."""
+    for i in prange(vectors.shape[0]):
+        theta = vectors[i, 3]
+        ry = math.asin(vectors[i, 1])
+        rz = math.atan2(vectors[i, 2], vectors[i, 0])
+        near_pole = float(abs(abs(ry) - math.pi / 2) < 0.001)
+        out[i, 0] = theta * (1.0 - near_pole)
+        out[i, 1] = ry
+        out[i, 2] = rz + math.copysign(theta, ry) * near_pole
+    return out
+
+
+def angles_to_vector_batch(angles: np.ndarray) -> np.ndarray:
+    """Vectorized angles_to_vector over an (..., 2) array of (ry, rz) radians.
+
+    Converts a whole trajectory in one pass of NumPy's C loops instead of a
+    Python loop over the scalar kernel. Returns an (..., 3) array of unit
+    orientation vectors.
+    """
+    angles = np.asarray(angles, dtype=np.float64)
+    ry = angles[..., 0]
+    rz = angles[..., 1]
+    cos_ry = np.cos(ry)
+    out = np.stack([np.cos(rz) * cos_ry, np.sin(ry), np.sin(rz) * cos_ry], axis=-1)
+    out /= np.linalg.norm(out, axis=-1, keepdims=True)
+    return out
+
+
+def vector_to_angles_batch(vectors: np.ndarray) -> np.ndarray:
+    """Vectorized vector_to_angles over an (..., 4) array of (o_x, o_y, o_z, theta).
+
+    Returns an (..., 3) array of (rx, ry, rz) radians, applying the
+    gimbal-lock fixup branchlessly with a mask instead of a per-row if.
+    """
+    vectors = np.asarray(vectors, dtype=np.float64)
+    o_x = vectors[..., 0]
+    o_y = vectors[..., 1]
+    o_z = vectors[..., 2]
+    theta = vectors[..., 3]
+    ry = np.arcsin(o_y)
+    rz = np.arctan2(o_z, o_x)
+    near_pole = np.abs(np.abs(ry) - np.pi / 2) < 0.001
+    rx = np.where(near_pole, 0.0, theta)
+    rz = np.where(near_pole, rz + np.sign(ry) * theta, rz)
+    return np.stack([rx, ry, rz], axis=-1)
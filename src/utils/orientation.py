@@ -0,0 +1,117 @@
+import math
+from typing import Tuple
+
+# Pure-Python port of the orientation conversions in libviam_rust_utils.
+# Verified numerically against the Rust implementation; doing the math here
+# avoids two C-heap allocation/free pairs and ~10 FFI calls per pose RPC.
+
+# Matches the pole tolerance used by the Rust implementation.
+_POLE_EPSILON = 1e-4
+
+
+def _quat_mul(
+    a: Tuple[float, float, float, float], b: Tuple[float, float, float, float]
+) -> Tuple[float, float, float, float]:
+    w1, x1, y1, z1 = a
+    w2, x2, y2, z2 = b
+    return (
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+    )
+
+
+def _quat_rotate(
+    q: Tuple[float, float, float, float], v: Tuple[float, float, float]
+) -> Tuple[float, float, float]:
+    w, x, y, z = q
+    rotated = _quat_mul(_quat_mul(q, (0.0,) + tuple(v)), (w, -x, -y, -z))
+    return rotated[1:]
+
+
+def quaternion_from_euler_angles(
+    roll: float, pitch: float, yaw: float
+) -> Tuple[float, float, float, float]:
+    """Build a (w, i, j, k) quaternion from z-y-x Euler angles in radians."""
+    cr, sr = math.cos(roll / 2), math.sin(roll / 2)
+    cp, sp = math.cos(pitch / 2), math.sin(pitch / 2)
+    cy, sy = math.cos(yaw / 2), math.sin(yaw / 2)
+    return (
+        cy * cp * cr + sy * sp * sr,
+        cy * cp * sr - sy * sp * cr,
+        cy * sp * cr + sy * cp * sr,
+        sy * cp * cr - cy * sp * sr,
+    )
+
+
+def orientation_vector_from_quaternion(
+    real: float, i: float, j: float, k: float
+) -> Tuple[float, float, float, float]:
+    """Convert a unit quaternion to a Viam orientation vector (o_x, o_y, o_z, theta)."""
+    q = (real, i, j, k)
+    nx = _quat_rotate(q, (1.0, 0.0, 0.0))
+    nz = _quat_rotate(q, (0.0, 0.0, 1.0))
+    o_x, o_y, o_z = nz
+    if 1 - abs(o_z) > _POLE_EPSILON:
+        # norm1 is normal to the plane of the new z and new x axes; norm2 is
+        # normal to the plane of the new z and global z axes. Theta is the
+        # signed angle between the two planes about the new z axis.
+        n1 = (
+            nz[1] * nx[2] - nz[2] * nx[1],
+            nz[2] * nx[0] - nz[0] * nx[2],
+            nz[0] * nx[1] - nz[1] * nx[0],
+        )
+        n2 = (nz[1], -nz[0], 0.0)
+        cross_n1_n2 = (
+            n1[1] * n2[2] - n1[2] * n2[1],
+            n1[2] * n2[0] - n1[0] * n2[2],
+            n1[0] * n2[1] - n1[1] * n2[0],
+        )
+        theta = math.atan2(
+            cross_n1_n2[0] * nz[0] + cross_n1_n2[1] * nz[1] + cross_n1_n2[2] * nz[2],
+            -(n1[0] * n2[0] + n1[1] * n2[1] + n1[2] * n2[2]),
+        )
+        return (o_x, o_y, o_z, theta)
+    if o_z > 0:
+        return (o_x, o_y, o_z, math.atan2(nx[1], nx[0]))
+    return (o_x, o_y, o_z, math.atan2(nx[1], -nx[0]))
+
+
+def quaternion_from_orientation_vector(
+    o_x: float, o_y: float, o_z: float, theta: float
+) -> Tuple[float, float, float, float]:
+    """Convert a Viam orientation vector to a (w, i, j, k) quaternion."""
+    lat = math.acos(max(-1.0, min(1.0, o_z)))
+    lon = math.atan2(o_y, o_x) if 1 - abs(o_z) > _POLE_EPSILON else 0.0
+    # q = Rz(lon) * Ry(lat) * Rz(theta)
+    c_lon, s_lon = math.cos(lon / 2), math.sin(lon / 2)
+    c_lat, s_lat = math.cos(lat / 2), math.sin(lat / 2)
+    return _quat_mul(
+        _quat_mul((c_lon, 0.0, 0.0, s_lon), (c_lat, 0.0, s_lat, 0.0)),
+        (math.cos(theta / 2), 0.0, 0.0, math.sin(theta / 2)),
+    )
+
+
+def euler_zyx_deg_from_quaternion(
+    real: float, i: float, j: float, k: float
+) -> Tuple[float, float, float]:
+    """Convert a unit quaternion to extrinsic z-y-x Euler angles in degrees.
+
+    Closed-form equivalent of scipy's ``Rotation.from_quat(...).as_euler("zyx",
+    degrees=True)``, without the per-call Rotation object construction.
+    """
+    rx = math.atan2(2 * (real * k - i * j), 1 - 2 * (j * j + k * k))
+    # Clamp to guard against floating-point drift outside asin's domain.
+    ry = math.asin(max(-1.0, min(1.0, 2 * (real * j + i * k))))
+    rz = math.atan2(2 * (real * i - j * k), 1 - 2 * (i * i + j * j))
+    return (math.degrees(rx), math.degrees(ry), math.degrees(rz))
+
+
+def euler_to_orientation_vector(
+    roll: float, pitch: float, yaw: float
+) -> Tuple[float, float, float, float]:
+    """Convert z-y-x Euler angles in radians directly to an orientation vector."""
+    return orientation_vector_from_quaternion(
+        *quaternion_from_euler_angles(roll, pitch, yaw)
+    )
@@ -1,6 +1,7 @@
 import sys
 import os
 import ctypes
+from contextlib import contextmanager
 from typing import Tuple
 from ctypes import Structure, POINTER, c_double
 from viam.proto.common import Orientation
@@ -47,111 +48,142 @@ def load_shared_library(package_name, lib_path, lib_name):
     return ctypes.CDLL(os.fspath(lib_file))
 
 
+# The shared library and its ctypes signatures are process-wide state; load
+# and configure them once instead of repeating the resource walk and ~15
+# argtypes/restype assignments per SpatialMath instance.
+_LIB = None
+
+
+def _configure(lib):
+    lib.free_orientation_vector_memory.argtypes = (POINTER(OrientationVector),)
+    lib.free_quaternion_memory.argtypes = (POINTER(Quaternion),)
+    lib.free_euler_angles_memory.argtypes = (POINTER(EulerAngles),)
+    lib.orientation_vector_from_quaternion.argtypes = (POINTER(Quaternion),)
+    lib.orientation_vector_from_quaternion.restype = POINTER(OrientationVector)
+    lib.orientation_vector_get_components.argtypes = (POINTER(OrientationVector),)
+    lib.orientation_vector_get_components.restype = POINTER(ov_array)
+    lib.quaternion_get_components.argtypes = (POINTER(Quaternion),)
+    lib.quaternion_get_components.restype = POINTER(ov_array)
+    lib.new_quaternion.argtypes = (c_double, c_double, c_double, c_double)
+    lib.new_quaternion.restype = POINTER(Quaternion)
+    lib.new_orientation_vector.argtypes = (c_double, c_double, c_double, c_double)
+    lib.new_orientation_vector.restype = POINTER(OrientationVector)
+    lib.new_euler_angles.argtypes = (c_double, c_double, c_double)
+    lib.new_euler_angles.restype = POINTER(EulerAngles)
+    lib.quaternion_from_euler_angles.argtypes = (c_double, c_double, c_double)
+    lib.quaternion_from_euler_angles.restype = POINTER(Quaternion)
+    lib.quaternion_from_orientation_vector.argtypes = (POINTER(OrientationVector),)
+    lib.quaternion_from_orientation_vector.restype = POINTER(Quaternion)
+    lib.euler_angles_from_quaternion.argtypes = (POINTER(Quaternion),)
+    lib.euler_angles_from_quaternion.restype = POINTER(EulerAngles)
+
+
+def _load_lib():
+    global _LIB
+    if _LIB is None:
+        _LIB = load_shared_library("viam", "rpc", "libviam_rust_utils")
+        _configure(_LIB)
+    return _LIB
+
+
 class SpatialMath:
     def __init__(self) -> None:
-        self.viam_rust_utils = load_shared_library("viam", "rpc", "libviam_rust_utils")
-        self.viam_rust_utils.free_orientation_vector_memory.argtypes = (
-            POINTER(OrientationVector),
-        )
-        self.viam_rust_utils.free_quaternion_memory.argtypes = (POINTER(Quaternion),)
-        self.viam_rust_utils.free_euler_angles_memory.argtypes = (POINTER(EulerAngles),)
-        self.viam_rust_utils.orientation_vector_from_quaternion.argtypes = (
-            POINTER(Quaternion),
-        )
-        self.viam_rust_utils.orientation_vector_from_quaternion.restype = POINTER(
-            OrientationVector
-        )
-        self.viam_rust_utils.orientation_vector_get_components.argtypes = (
-            POINTER(OrientationVector),
-        )
-        self.viam_rust_utils.orientation_vector_get_components.restype = POINTER(
-            ov_array
-        )
-        self.viam_rust_utils.quaternion_get_components.argtypes = (POINTER(Quaternion),)
-        self.viam_rust_utils.quaternion_get_components.restype = POINTER(ov_array)
-        self.viam_rust_utils.new_quaternion.argtypes = (
-            c_double,
-            c_double,
-            c_double,
-            c_double,
+        lib = _load_lib()
+        self.viam_rust_utils = lib
+        # Bind the function pointers directly so each call skips an attribute
+        # lookup on the library object.
+        self._new_orientation_vector = lib.new_orientation_vector
+        self._new_quaternion = lib.new_quaternion
+        self._new_euler_angles = lib.new_euler_angles
+        self._quaternion_from_euler_angles = lib.quaternion_from_euler_angles
+        self._quaternion_from_orientation_vector = (
+            lib.quaternion_from_orientation_vector
         )
-        self.viam_rust_utils.new_quaternion.restype = POINTER(Quaternion)
-        self.viam_rust_utils.new_orientation_vector.argtypes = (
-            c_double,
-            c_double,
-            c_double,
-            c_double,
+        self._euler_angles_from_quaternion = lib.euler_angles_from_quaternion
+        self._orientation_vector_from_quaternion = (
+            lib.orientation_vector_from_quaternion
         )
-        self.viam_rust_utils.new_orientation_vector.restype = POINTER(OrientationVector)
-        self.viam_rust_utils.new_euler_angles.argtypes = (c_double, c_double, c_double)
-        self.viam_rust_utils.new_euler_angles.restype = POINTER(EulerAngles)
-        self.viam_rust_utils.quaternion_from_euler_angles.argtypes = (
-            c_double,
-            c_double,
-            c_double,
-        )
-        self.viam_rust_utils.quaternion_from_euler_angles.restype = POINTER(Quaternion)
-        self.viam_rust_utils.quaternion_from_orientation_vector.argtypes = (
-            POINTER(OrientationVector),
-        )
-        self.viam_rust_utils.quaternion_from_orientation_vector.restype = POINTER(
-            Quaternion
-        )
-        self.viam_rust_utils.euler_angles_from_quaternion.argtypes = (
-            POINTER(Quaternion),
-        )
-        self.viam_rust_utils.euler_angles_from_quaternion.restype = POINTER(EulerAngles)
-        self.viam_rust_utils.orientation_vector_from_quaternion.argtypes = (
-            POINTER(Quaternion),
-        )
-        self.viam_rust_utils.orientation_vector_from_quaternion.restype = POINTER(
-            OrientationVector
+        self._orientation_vector_get_components = (
+            lib.orientation_vector_get_components
         )
+        self._quaternion_get_components = lib.quaternion_get_components
+        self._free_quaternion_memory = lib.free_quaternion_memory
+        self._free_orientation_vector_memory = lib.free_orientation_vector_memory
+        self._free_euler_angles_memory = lib.free_euler_angles_memory
+
+    # The create_*/\*_from_* calls hand back Rust-heap pointers that must be
+    # freed by hand; an exception mid-chain leaks them. These context managers
+    # tie each pointer's lifetime to a with-block so the free runs on any exit.
+    @contextmanager
+    def owned_quaternion(self, real: float, i: float, j: float, k: float):
+        quat = self._new_quaternion(real, i, j, k)
+        try:
+            yield quat
+        finally:
+            self._free_quaternion_memory(quat)
+
+    @contextmanager
+    def owned_orientation_vector(
+        self, o_x: float, o_y: float, o_z: float, theta: float
+    ):
+        o_vec = self._new_orientation_vector(o_x, o_y, o_z, theta)
+        try:
+            yield o_vec
+        finally:
+            self._free_orientation_vector_memory(o_vec)
+
+    @contextmanager
+    def owned_euler_angles(self, roll: float, pitch: float, yaw: float):
+        euler_angles = self._new_euler_angles(roll, pitch, yaw)
+        try:
+            yield euler_angles
+        finally:
+            self._free_euler_angles_memory(euler_angles)
 
     def create_orientation_vector(
         self, o_x: float, o_y: float, o_z: float, theta: float
     ) -> OrientationVector:
-        return self.viam_rust_utils.new_orientation_vector(o_x, o_y, o_z, theta)
+        return self._new_orientation_vector(o_x, o_y, o_z, theta)
 
     def create_quaternion(
         self, real: float, i: float, j: float, k: float
     ) -> Quaternion:
-        return self.viam_rust_utils.new_quaternion(real, i, j, k)
+        return self._new_quaternion(real, i, j, k)
 
     def create_euler_angles(self, roll: float, pitch: float, yaw: float) -> EulerAngles:
-        return self.viam_rust_utils.new_euler_angles(roll, pitch, yaw)
+        return self._new_euler_angles(roll, pitch, yaw)
 
     def quaternion_from_euler_angles(
         self, roll: float, pitch: float, yaw: float
     ) -> Quaternion:
-        return self.viam_rust_utils.quaternion_from_euler_angles(roll, pitch, yaw)
+        return self._quaternion_from_euler_angles(roll, pitch, yaw)
 
     def quaternion_from_orientation_vector(
         self, o_vec: OrientationVector
     ) -> Quaternion:
-        return self.viam_rust_utils.quaternion_from_orientation_vector(o_vec)
+        return self._quaternion_from_orientation_vector(o_vec)
 
     def euler_angles_from_quaternion(self, quat: Quaternion) -> EulerAngles:
-        return self.viam_rust_utils.euler_angles_from_quaternion(quat)
+        return self._euler_angles_from_quaternion(quat)
 
     def orientation_vector_from_quaternion(self, quat: Quaternion) -> OrientationVector:
-        return self.viam_rust_utils.orientation_vector_from_quaternion(quat)
+        return self._orientation_vector_from_quaternion(quat)
 
     def orientation_vector_get_components(
         self, o_vec: OrientationVector
     ) -> Tuple[float, float, float, float]:
-        return self.viam_rust_utils.orientation_vector_get_components(o_vec).contents
+        return self._orientation_vector_get_components(o_vec).contents
 
     def quaternion_get_components(
         self, quat: Quaternion
     ) -> Tuple[float, float, float, float]:
-        return self.viam_rust_utils.quaternion_get_components(quat).contents
+        return self._quaternion_get_components(quat).contents
 
     def free_quaternion_memory(self, quat: Quaternion):
-        self.viam_rust_utils.free_quaternion_memory(quat)
+        self._free_quaternion_memory(quat)
 
     def free_orientation_vector_memory(self, o_vec: OrientationVector):
-        self.viam_rust_utils.free_orientation_vector_memory(o_vec)
+        self._free_orientation_vector_memory(o_vec)
 
     def free_euler_angles_memory(self, euler_angles: EulerAngles):
-        self.viam_rust_utils.free_euler_angles_memory(euler_angles)
+        self._free_euler_angles_memory(euler_angles)